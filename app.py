@@ -1,299 +1,416 @@
-# RUN: uvicorn app:app --reload
-
-# Import necessary libraries
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-import requests
-from bs4 import BeautifulSoup
-import json
-import os
-import logging
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
-
-# Initialize logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-app = FastAPI(
-    title="Yahoo Latest Stock News API",
-    description="A REST API that provides the latest stock news from Yahoo Finance",
-    version="1.0.0",
-    contact={
-        "name": "API Support",
-        "email": "support@example.com",
-    },
-    license_info={
-        "name": "MIT",
-    },
-)
-
-# Define the path for the news file
-NEWS_FILE = "latest_news.json"
-
-# Function to scrape and update the news file
-def update_news_cache():
-    """
-    Scrapes the latest news from Yahoo Finance and saves it to a JSON file.
-    This function runs periodically in the background.
-    """
-    logger.info("Starting scheduled news update...")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/139.0.0.0 Safari/537.36",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    url = "https://finance.yahoo.com/topic/latest-news/"
-    
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status() # Raise an exception for bad status codes
-        soup = BeautifulSoup(response.text, "lxml")
-        scripts = soup.find_all("script", {"type": "application/json", "data-sveltekit-fetched": True})
-        
-        filtered_stories = []
-
-        for script_tag in scripts:
-            outer_json = json.loads(script_tag.string)
-            body = outer_json.get("body", "")
-            if body.startswith("{"):
-                try:
-                    body_json = json.loads(body)
-                    main_stream = body_json.get("data", {}).get("main", {}).get("stream", [])
-                    if main_stream:
-                        for story in main_stream:
-                            content = story.get("content", {})
-                            finance = content.get("finance") or {}
-                            tickers = finance.get("stockTickers")
-                            if tickers is None:
-                                tickers = []
-                            
-                            story_info = {
-                                "id": content.get("id"),
-                                "title": content.get("title"),
-                                "pubDate": content.get("pubDate"), # Remember: This is in UTC time
-                                # "providerContentUrl": content.get("providerContentUrl"),
-                                "canonicalUrl": content.get("canonicalUrl", {}).get("url"),
-                                "stockTickers": [t.get("symbol") for t in tickers]
-                            }
-                            filtered_stories.append(story_info)
-                        break # Stop after finding and processing the first main stream
-                except json.JSONDecodeError:
-                    continue
-        
-        # Save the scraped data to the news file
-        with open(NEWS_FILE, "w") as f:
-            json.dump(filtered_stories, f)
-        
-        logger.info(f"News updated successfully at {datetime.now()}")
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch news from Yahoo: {e}")
-    except IOError as e:
-        logger.error(f"Failed to write to file: {e}")
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during news update: {e}")
-
-# Create the scheduler instance
-scheduler = BackgroundScheduler()
-
-@app.on_event("startup")
-def startup_event():
-    """
-    Event handler that runs when the API application starts.
-    It initializes the news file and starts the scheduler.
-    """
-    logger.info("Application starting up...")
-    
-    # Run the file update function immediately to populate the file
-    # before the first user request.
-    update_news_cache()
-    
-    # Add the update job to the scheduler to run every minute
-    scheduler.add_job(
-        update_news_cache,
-        trigger=IntervalTrigger(minutes=1),
-        id="news_job",
-        name="Update news",
-        replace_existing=True
-    )
-    
-    # Start the scheduler
-    scheduler.start()
-    logger.info("Scheduler started.")
-
-@app.on_event("shutdown")
-def shutdown_event():
-    """
-    Event handler that runs when the FastAPI application shuts down.
-    It shuts down the scheduler gracefully.
-    """
-    logger.info("Application shutting down...")
-    scheduler.shutdown()
-    logger.info("Scheduler shut down.")
-
-@app.get("/health")
-def health_check():
-    """
-    Health check endpoint for monitoring and load balancers.
-    
-    Returns:
-        JSONResponse: API health status and basic information.
-    """
-    try:
-        # Check if news file exists and is readable
-        news_file_status = "available" if os.path.exists(NEWS_FILE) else "initializing"
-        
-        # Check scheduler status
-        scheduler_status = "running" if scheduler.running else "stopped"
-        
-        return JSONResponse(content={
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "service": "Yahoo Latest Stock News API",
-            "version": "1.0.0",
-            "news_cache": news_file_status,
-            "scheduler": scheduler_status
-        })
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(status_code=503, detail="Service temporarily unavailable")
-
-@app.get("/")
-def root():
-    """
-    Root endpoint providing API information.
-    
-    Returns:
-        JSONResponse: Basic API information and available endpoints.
-    """
-    return JSONResponse(content={
-        "message": "Yahoo Latest Stock News API",
-        "version": "1.0.0",
-        "endpoints": {
-            "/health": "Health check endpoint",
-            "/news": "Get latest news",
-            "/news/{article_id}": "Get full article content by ID"
-        }
-    })
-
-@app.get("/news")
-def get_latest_news_from_cache(limit: int = 50):
-    """
-    Retrieves the latest news from the local news file.
-    
-    Args:
-        limit (int): The maximum number of news stories to return.
-    
-    Returns:
-        JSONResponse: A list of the latest news stories.
-    
-    Raises:
-        HTTPException: If the news file does not exist.
-    """
-    logger.info(f"Received request for news, serving from file.")
-    
-    # Check if the file exists
-    if not os.path.exists(NEWS_FILE):
-        logger.warning("File not found, a new update will be triggered on next interval.")
-        raise HTTPException(
-            status_code=503,
-            detail="News file is not yet available. Please try again in a moment."
-        )
-
-    try:
-        # Read the data from the file
-        with open(NEWS_FILE, "r") as f:
-            cached_data = json.load(f)
-            
-        # Return the requested number of stories
-        return JSONResponse(content=cached_data[:limit])
-    
-    except json.JSONDecodeError:
-        logger.error("Error decoding JSON from file. File might be corrupted.")
-        raise HTTPException(
-            status_code=500,
-            detail="An error occurred while reading the news file."
-        )
-    except IOError:
-        logger.error("Error reading news file.")
-        raise HTTPException(
-            status_code=500,
-            detail="An error occurred while reading the news file."
-        )
-    
-@app.get("/news/{article_id}")
-def get_article_content(article_id: str):
-    """
-    Retrieves the full HTML content of a news article by its ID and returns a JSON object
-    with the article's title, URL, paragraph count, and a list of paragraphs.
-    
-    Args:
-        article_id (str): The ID of the news article to retrieve.
-    
-    Returns:
-        JSONResponse: A structured JSON object with the article data.
-    
-    Raises:
-        HTTPException: If the article is not found or cannot be retrieved.
-    """
-    logger.info(f"Received request for article ID: {article_id}")
-    
-    # Ensure news file exists
-    if not os.path.exists(NEWS_FILE):
-        raise HTTPException(status_code=503, detail="News file is not yet available.")
-    
-    try:
-        # Read the data from the file
-        with open(NEWS_FILE, "r") as f:
-            cached_data = json.load(f)
-            
-        # Find the article with the matching ID
-        article = next((item for item in cached_data if item["id"] == article_id), None)
-        
-        if not article:
-            raise HTTPException(status_code=404, detail="Article not found.")
-
-        canonical_url = article.get("canonicalUrl")
-        if not canonical_url:
-            logger.error(f"URL not found for article ID: {article_id}")
-            raise HTTPException(status_code=500, detail="Article data is corrupted or incomplete.")
-
-        # Make a GET request to the canonical URL
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                          "AppleWebKit/537.36 (KHTML, like Gecko) "
-                          "Chrome/139.0.0.0 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        
-        article_response = requests.get(canonical_url, headers=headers, timeout=10)
-        article_response.raise_for_status()
-        
-        # Parse the HTML content and extract all paragraph text
-        soup = BeautifulSoup(article_response.text, "html.parser")
-        paragraphs = soup.find_all("p")
-        article_paragraphs = [p.get_text() for p in paragraphs]
-
-        # Create the structured JSON response
-        article_data = {
-            "id": article_id,
-            "title": article.get("title"),
-            "url": canonical_url,
-            "paragraph_count": len(article_paragraphs),
-            "paragraphs": article_paragraphs
-        }
-        
-        return JSONResponse(content=article_data)
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch content from URL {canonical_url}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve article content.")
-    except json.JSONDecodeError:
-        logger.error("Error decoding JSON from news file. File might be corrupted.")
-        raise HTTPException(status_code=500, detail="An error occurred while reading the news file.")
-    except IOError:
-        logger.error("Error reading news file.")
-        raise HTTPException(status_code=500, detail="An error occurred while reading the news file.")
\ No newline at end of file
+# RUN: uvicorn app:app --reload
+
+# Import necessary libraries
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+import requests
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+import jmespath
+import orjson
+import hashlib
+import mmap
+import os
+import re
+import asyncio
+import concurrent.futures
+from cachetools import TTLCache
+import logging
+import threading
+from datetime import datetime
+
+# Initialize logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(
+    title="Yahoo Latest Stock News API",
+    description="A REST API that provides the latest stock news from Yahoo Finance",
+    version="1.0.0",
+    contact={
+        "name": "API Support",
+        "email": "support@example.com",
+    },
+    license_info={
+        "name": "MIT",
+    },
+    default_response_class=ORJSONResponse,
+)
+
+# Compress JSON responses above 500 bytes for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Define the path for the news file
+NEWS_FILE = "latest_news.json"
+
+# Headers sent with every outbound request to Yahoo
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/139.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    # Prefer Brotli; requests/httpx decompress transparently once the
+    # brotli package is installed.
+    "Accept-Encoding": "br, gzip",
+}
+
+# Persistent session for the scheduled scrape so the once-a-minute fetch
+# reuses its keep-alive connection instead of a fresh TLS handshake. A
+# single-connection pool is enough since it only ever talks to one host.
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# In-memory news cache. The scheduler thread is the sole writer, so request
+# handlers only ever read these; the lock guards the swap of both structures.
+CACHE: list = []
+CACHE_BY_ID: dict = {}
+CACHE_LOCK = threading.Lock()
+
+# Response bytes for common /news?limit=N values, serialized once per
+# scheduler tick instead of on every request. Maps limit -> (etag, body).
+PRESERIALIZED_LIMITS = (10, 25, 50, 100)
+PRESERIALIZED: dict = {}
+
+# Fetched article bodies, so repeat hits on a popular story skip the
+# upstream round trip. Failures get a shorter TTL in a separate cache so
+# dead links aren't hammered but recover quickly if transient.
+ARTICLE_CACHE = TTLCache(maxsize=512, ttl=300)
+ARTICLE_FAILURES = TTLCache(maxsize=512, ttl=60)
+
+# Matches the sveltekit-fetched JSON payloads embedded in the Yahoo topic
+# page, so the scraper can skip building a DOM over the full document.
+SCRIPT_RE = re.compile(rb'<script[^>]*data-sveltekit-fetched[^>]*>(.*?)</script>', re.DOTALL)
+
+# Compiled projection over the decoded stream blob: one pass extracts
+# exactly the story fields we keep. pubDate is in UTC time.
+STORY_EXTRACT = jmespath.compile(
+    "data.main.stream[].content.{"
+    "id: id, title: title, pubDate: pubDate, "
+    "canonicalUrl: canonicalUrl.url, "
+    "stockTickers: finance.stockTickers[].symbol || `[]`}"
+)
+
+# Worker-side half of the news update: fetch and parse only
+def _scrape_and_parse():
+    """
+    Fetches the Yahoo topic page and parses it into a list of story dicts.
+    Runs in the worker process so HTML/JSON parsing never stalls the
+    event loop; failures propagate to the caller.
+    """
+    url = "https://finance.yahoo.com/topic/latest-news/"
+
+    response = SESSION.get(url, timeout=10)
+    response.raise_for_status() # Raise an exception for bad status codes
+    filtered_stories = []
+
+    for match in SCRIPT_RE.finditer(response.content):
+        raw = match.group(1)
+        # Cheap substring check: only one script carries the main stream,
+        # so skip full JSON parsing of everything else. The stream keys
+        # live inside the outer JSON's "body" string, so their quotes are
+        # backslash-escaped in the raw bytes.
+        if rb'\"main\"' not in raw or rb'\"stream\"' not in raw:
+            continue
+        try:
+            outer_json = orjson.loads(raw)
+            body = outer_json.get("body", "")
+            # Slice compare beats a startswith method call per script
+            if body[:1] == "{":
+                body_json = orjson.loads(body)
+                stories = STORY_EXTRACT.search(body_json)
+                if stories:
+                    filtered_stories = stories
+                    break # Stop after finding and processing the first main stream
+        except (orjson.JSONDecodeError, KeyError):
+            continue
+
+    return filtered_stories
+
+# Main-process half: publish parsed stories to the cache and the file
+def publish_news_cache(filtered_stories):
+    """
+    Swaps the in-memory cache to the freshly parsed stories and persists
+    them to the news file.
+    """
+    global CACHE, CACHE_BY_ID, PRESERIALIZED
+
+    # Pre-serialize the common response sizes, each tagged with a short
+    # content hash so /news can answer If-None-Match with a 304. ETags
+    # are opaque quoted strings per RFC 7232.
+    preserialized = {}
+    for n in PRESERIALIZED_LIMITS:
+        body = orjson.dumps(filtered_stories[:n])
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        preserialized[n] = (etag, body)
+
+    # Publish the fresh data to the in-memory cache
+    with CACHE_LOCK:
+        CACHE = filtered_stories
+        CACHE_BY_ID = {story["id"]: story for story in filtered_stories}
+        PRESERIALIZED = preserialized
+
+    # Save the scraped data to the news file. Write to a sibling temp
+    # file and rename so readers never see a partially written snapshot.
+    tmp_file = NEWS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(filtered_stories))
+    os.replace(tmp_file, NEWS_FILE)
+
+# Cold-start fallback: restore the cache from the persisted snapshot
+def _load_cache_from_file():
+    """
+    Restores the in-memory cache from the news file, e.g. when the first
+    scrape after a restart fails. Memory-mapping hands orjson a zero-copy
+    view of the file instead of read() allocating a full bytes copy; the
+    atomic os.replace() writes guarantee the mapped region is a complete
+    snapshot.
+    """
+    if not os.path.exists(NEWS_FILE):
+        return
+    try:
+        with open(NEWS_FILE, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # orjson takes bytes-like objects, not the mmap itself
+                stories = orjson.loads(memoryview(mm))
+            finally:
+                mm.close()
+        if stories:
+            publish_news_cache(stories)
+            logger.info("News cache restored from file snapshot.")
+    except (orjson.JSONDecodeError, IOError, ValueError) as e:
+        logger.error(f"Failed to restore cache from file: {e}")
+
+async def update_news_cache():
+    """
+    Runs one news update: scrape and parse in the worker process, then
+    publish the result from the main process.
+    """
+    logger.info("Starting scheduled news update...")
+    try:
+        loop = asyncio.get_running_loop()
+        filtered_stories = await loop.run_in_executor(app.state.pool, _scrape_and_parse)
+
+        # Never clobber a good cache or snapshot with an empty parse
+        # result, e.g. if Yahoo changes its page structure.
+        if not filtered_stories:
+            logger.warning("Scrape returned no stories; keeping existing cache.")
+            return
+
+        publish_news_cache(filtered_stories)
+
+        logger.info(f"News updated successfully at {datetime.now()}")
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to fetch news from Yahoo: {e}")
+    except IOError as e:
+        logger.error(f"Failed to write to file: {e}")
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during news update: {e}")
+
+# Background task that refreshes the news cache once a minute
+async def periodic_news_updater():
+    """
+    Runs the scraper every minute, off the event loop so request
+    handling stays responsive while Yahoo's HTML is parsed.
+    """
+    while True:
+        await asyncio.sleep(60)
+        await update_news_cache()
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    Event handler that runs when the API application starts.
+    It populates the news cache and starts the background updater.
+    """
+    logger.info("Application starting up...")
+
+    # Create a shared async HTTP client so article fetches reuse
+    # pooled keep-alive connections and TLS sessions.
+    app.state.client = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
+    # One worker process keeps HTML/JSON parsing off the event loop's core
+    app.state.pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+
+    # Serve the persisted snapshot, if any, until fresh data lands; a
+    # non-empty scrape supersedes it and an empty or failed one cannot
+    # clobber it.
+    _load_cache_from_file()
+
+    # Run the cache update immediately to populate the cache
+    # before the first user request.
+    await update_news_cache()
+
+    # Start the background updater task
+    app.state.updater = asyncio.create_task(periodic_news_updater())
+    logger.info("Background updater started.")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Event handler that runs when the FastAPI application shuts down.
+    It stops the background updater and the HTTP client gracefully.
+    """
+    logger.info("Application shutting down...")
+    app.state.updater.cancel()
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+    await app.state.client.aclose()
+    logger.info("Background updater shut down.")
+
+@app.get("/health")
+async def health_check():
+    """
+    Health check endpoint for monitoring and load balancers.
+    
+    Returns:
+        dict: API health status and basic information.
+    """
+    try:
+        # Check if the in-memory cache has been populated
+        news_file_status = "available" if CACHE else "initializing"
+        
+        # Check background updater status
+        updater = getattr(app.state, "updater", None)
+        scheduler_status = "running" if updater is not None and not updater.done() else "stopped"
+
+        return {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "service": "Yahoo Latest Stock News API",
+            "version": "1.0.0",
+            "news_cache": news_file_status,
+            "scheduler": scheduler_status
+        }
+    except Exception as e:
+        logger.error(f"Health check failed: {e}")
+        raise HTTPException(status_code=503, detail="Service temporarily unavailable")
+
+@app.get("/")
+async def root():
+    """
+    Root endpoint providing API information.
+    
+    Returns:
+        dict: Basic API information and available endpoints.
+    """
+    return {
+        "message": "Yahoo Latest Stock News API",
+        "version": "1.0.0",
+        "endpoints": {
+            "/health": "Health check endpoint",
+            "/news": "Get latest news",
+            "/news/{article_id}": "Get full article content by ID"
+        }
+    }
+
+@app.get("/news")
+async def get_latest_news_from_cache(request: Request, limit: int = 50):
+    """
+    Retrieves the latest news from the in-memory cache.
+
+    Args:
+        limit (int): The maximum number of news stories to return.
+
+    Returns:
+        Response: A list of the latest news stories.
+
+    Raises:
+        HTTPException: If the news cache has not been populated yet.
+    """
+    logger.info(f"Received request for news, serving from cache.")
+
+    # Check if the cache has been populated
+    if not CACHE:
+        logger.warning("Cache is empty, a new update will be triggered on next interval.")
+        raise HTTPException(
+            status_code=503,
+            detail="News cache is not yet available. Please try again in a moment."
+        )
+
+    # Serve pre-serialized bytes for the common limits, honoring
+    # If-None-Match so unchanged data costs no payload at all.
+    cached_response = PRESERIALIZED.get(limit)
+    if cached_response is not None:
+        etag, body = cached_response
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match.removeprefix("W/") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    # Uncommon limit: serialize the slice on demand
+    return Response(content=orjson.dumps(CACHE[:limit]), media_type="application/json")
+    
+@app.get("/news/{article_id}")
+async def get_article_content(article_id: str):
+    """
+    Retrieves the full HTML content of a news article by its ID and returns a JSON object
+    with the article's title, URL, paragraph count, and a list of paragraphs.
+    
+    Args:
+        article_id (str): The ID of the news article to retrieve.
+    
+    Returns:
+        dict: A structured JSON object with the article data.
+    
+    Raises:
+        HTTPException: If the article is not found or cannot be retrieved.
+    """
+    logger.info(f"Received request for article ID: {article_id}")
+
+    # Ensure the cache has been populated
+    if not CACHE:
+        raise HTTPException(status_code=503, detail="News cache is not yet available.")
+
+    # Serve a recently fetched copy, or a recently recorded failure,
+    # without touching the upstream
+    cached_article = ARTICLE_CACHE.get(article_id)
+    if cached_article is not None:
+        return cached_article
+    cached_failure = ARTICLE_FAILURES.get(article_id)
+    if cached_failure is not None:
+        raise HTTPException(status_code=cached_failure[0], detail=cached_failure[1])
+
+    try:
+        # Look up the article by ID
+        article = CACHE_BY_ID.get(article_id)
+
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found.")
+
+        canonical_url = article.get("canonicalUrl")
+        if not canonical_url:
+            logger.error(f"URL not found for article ID: {article_id}")
+            raise HTTPException(status_code=500, detail="Article data is corrupted or incomplete.")
+
+        # Make a GET request to the canonical URL via the shared client
+        article_response = await app.state.client.get(canonical_url)
+        article_response.raise_for_status()
+        
+        # Parse the HTML content and extract all paragraph text
+        article_tree = LexborHTMLParser(article_response.text)
+        article_paragraphs = [p.text() for p in article_tree.css("p")]
+
+        # Create the structured JSON response
+        article_data = {
+            "id": article_id,
+            "title": article.get("title"),
+            "url": canonical_url,
+            "paragraph_count": len(article_paragraphs),
+            "paragraphs": article_paragraphs
+        }
+
+        ARTICLE_CACHE[article_id] = article_data
+        return article_data
+
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to fetch content from URL {canonical_url}: {e}")
+        ARTICLE_FAILURES[article_id] = (500, "Failed to retrieve article content.")
+        raise HTTPException(status_code=500, detail="Failed to retrieve article content.")
\ No newline at end of file